@@ -14,18 +14,24 @@ Flow:
 """
 
 import html as html_mod
+import json
 import logging
 import os
 import re
+import time
 from datetime import date, datetime
+from pathlib import Path
 from zoneinfo import ZoneInfo
 
 import requests
 
 NL_TZ = ZoneInfo("Europe/Amsterdam")
 
+BASE_DIR = Path(__file__).parent
+
 BASE_URL = "https://tpv-heksenwiel.knltb.site"
 HTTP_TIMEOUT = 15  # Seconden per HTTP-request (voorkomt dat trage responses de retry-loop blokkeren)
+SESSIE_MAX_LEEFTIJD_SEC = 24 * 3600  # Opgeslagen sessies ouder dan dit worden niet hergebruikt
 
 PADEL_COURTS = {
     1: "27247a4e-0443-411a-be10-ba08ccd40cde",
@@ -37,10 +43,86 @@ PADEL_COURTS = {
 PADEL_COURT_NAMES = {v: f"Padel {k}" for k, v in PADEL_COURTS.items()}
 
 
+def _alternatie(indicatoren: tuple[str, ...]) -> re.Pattern:
+    """Compileer een indicatorlijst tot één case-insensitive alternation."""
+    return re.compile("|".join(map(re.escape, indicatoren)), re.IGNORECASE)
+
+
+# Teksten waaraan we de uitkomst van de court-POST en de AJAX-bevestiging
+# herkennen, in volgorde van prioriteit; met bijbehorend voorgecompileerd patroon
+_SUCCES_INDICATOREN = (
+    "reservering geplaatst", "reservering bevestigd",
+    "succesvol gereserveerd", "gelukt", "bevestigd",
+)
+_SUCCES_RE = _alternatie(_SUCCES_INDICATOREN)
+_COURT_FOUT_INDICATOREN = (
+    "heeft al een reservering", "maximaal", "bezet",
+    "niet beschikbaar", "er is een fout", "fout opgetreden",
+    "an error occurred", "server error",
+)
+_COURT_FOUT_RE = _alternatie(_COURT_FOUT_INDICATOREN)
+_BEVESTIG_FOUT_INDICATOREN = (
+    "heeft al een reservering", "maximaal", "niet beschikbaar",
+    "er is een fout", "fout opgetreden", "server error",
+)
+_BEVESTIG_FOUT_RE = _alternatie(_BEVESTIG_FOUT_INDICATOREN)
+# Fouten waarbij opnieuw proberen zinloos is
+_DEFINITIEVE_FOUT_INDICATOREN = (
+    "heeft al een reservering", "maximaal", "niet toegestaan",
+)
+_DEFINITIEVE_FOUT_RE = _alternatie(_DEFINITIEVE_FOUT_INDICATOREN)
+
+# Startuur van het dagdeel (ochtend 8u, middag 12u, avond 18u) per uur van de dag
+_DAGDEEL_UUR = (8,) * 12 + (12,) * 5 + (18,) * 7
+
+# Voorgecompileerde patronen voor het parsen van de KNLTB-pagina's.
+# Deze worden bij elke retry-poging opnieuw toegepast, dus compileer ze eenmalig.
+# Login-formulier zichtbaar (= niet ingelogd); één case-insensitive scan i.p.v. lower() + losse checks
+_LOGIN_FORM_RE = re.compile(r'type="password"|type=\'password\'|login\.password', re.IGNORECASE)
+_CSRF_RE = re.compile(r'__RequestVerificationToken.*?value="([^"]+)"')
+_SPELER_CARD_RE = re.compile(
+    r'class="card-body\s+addPlayer"[^>]*data-id="([a-f0-9-]+)"[^>]*>(.*?)</div>',
+    re.DOTALL,
+)
+_TAG_RE = re.compile(r'<[^>]+>')
+_WHITESPACE_RE = re.compile(r'\s+')
+_TIMEINCOURT_RE = re.compile(
+    r'<div\b[^>]*class="([^"]*\btimeincourt\b[^"]*)"[^>]*>(.*?)</div>', re.DOTALL,
+)
+_SELECT_RE = re.compile(
+    r'<select\b([^>]*)data-court="([a-f0-9-]+)"([^>]*)>(.*?)</select>', re.DOTALL,
+)
+_OPTION_RE = re.compile(r'<option\b([^>]*)>([^<]*)</option>')
+_OPTION_VALUE_RE = re.compile(r'value="([^"]+)"')
+_OPTION_END_RE = re.compile(r'data-end-?time="([^"]+)"')
+_HHMM_RE = re.compile(r'(\d{2}:\d{2})')
+_TIMEINCOURT_TAG_RE = re.compile(r'<[^>]*\btimeincourt\b[^>]*>')
+# Save-URL op de bevestigingspagina: groep 1 = de confirm-button (voorkeur),
+# groep 2 = een willekeurige SaveReservation data-url (fallback)
+_SAVE_URL_RE = re.compile(
+    r'id="confirmReservationButton"[^>]*data-url="([^"]+)"'
+    r'|data-url="(/Ajax/Profile/SaveReservation[^"]*)"'
+)
+
+
 class ReserveringError(Exception):
     pass
 
 
+def _zoek_indicator(tekst: str, indicatoren: tuple[str, ...], patroon: re.Pattern) -> str | None:
+    """
+    Return de eerste indicator (in prioriteitsvolgorde) die in de tekst voorkomt.
+
+    Eén regex-pass met het voorgecompileerde `patroon` (zie _alternatie) over
+    de (mogelijk grote) pagina i.p.v. een lower()-kopie plus een aparte
+    substring-scan per indicator.
+    """
+    gevonden = {m.group(0).lower() for m in patroon.finditer(tekst)}
+    if not gevonden:
+        return None
+    return next((i for i in indicatoren if i in gevonden), None)
+
+
 class _TimeoutSession(requests.Session):
     """Session met een standaard timeout op alle requests."""
 
@@ -59,13 +141,37 @@ class ApiReserveringBot:
         self._session: requests.Session | None = None
         self._speler_guids: dict[str, str] = {}
         self._laatste_fout: str | None = None
+        # HTML van de dag-selectiepagina na het submitten van de spelers;
+        # eenmalig bruikbaar voor het CSRF-token van de dag-POST.
+        self._dag_html: str | None = None
+        # True zolang de wizard (spelers ingediend) nog op de dag-selectie staat;
+        # dan kan een retry direct de dag opnieuw kiezen zonder spelers toe te voegen.
+        self._wizard_op_dagstap = False
+        # True zolang de sessie uit een eerdere run komt en nog niet is bevestigd
+        self._sessie_hergebruikt = False
+        # HTML-dumps kosten een schrijfactie per poging; alleen voor diagnose
+        self._debug_dumps = config.get("debug", {}).get("html_dumps", False)
+        self._court_gedumpt = False
 
     def start(self):
-        """Start een HTTP-sessie en log in."""
+        """
+        Start een HTTP-sessie en log in.
+
+        Als er een opgeslagen sessie van een eerdere run is, wordt die
+        hergebruikt en de login overgeslagen. Blijkt die sessie bij de eerste
+        pagina verlopen, dan wordt alsnog ingelogd (zie _laad_spelers_pagina).
+        """
         self._session = _TimeoutSession()
         self._session.headers.update({
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
         })
+        if self._laad_sessie():
+            self._sessie_hergebruikt = True
+            self._log.info(
+                f"Opgeslagen sessie hergebruikt ({len(self._session.cookies)} cookies), "
+                f"login overgeslagen"
+            )
+            return
         self._login()
 
     def stop(self):
@@ -75,13 +181,87 @@ class ApiReserveringBot:
             self._session = None
         self._log.info("Sessie gesloten")
 
-    def _login(self):
+    def _credentials(self) -> tuple[str, str]:
         creds = self.config["credentials"]
         username = os.environ.get("KNLTB_USERNAME", "") or creds.get("username", "")
         password = os.environ.get("KNLTB_PASSWORD", "") or creds.get("password", "")
+        return username, password
+
+    def _sessie_bestand(self) -> Path:
+        """Bestand met de cookies van deze bot (per label, zodat parallelle bots elk een eigen sessie houden)."""
+        suffix = f"-{self.label}" if self.label else ""
+        return BASE_DIR / f".sessie{suffix}.json"
+
+    def _laad_sessie(self) -> bool:
+        """Laad cookies van een eerdere run in de sessie. Returns True als dat gelukt is."""
+        pad = self._sessie_bestand()
+        try:
+            leeftijd = time.time() - pad.stat().st_mtime
+            if leeftijd > SESSIE_MAX_LEEFTIJD_SEC:
+                self._log.debug(f"Opgeslagen sessie te oud ({leeftijd / 3600:.1f} uur), opnieuw inloggen")
+                return False
+            with open(pad, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return False
+        except (OSError, ValueError) as e:
+            self._log.debug(f"Opgeslagen sessie onleesbaar ({pad}): {e}")
+            return False
+
+        username, _ = self._credentials()
+        if not username or data.get("username") != username:
+            return False
+
+        for c in data.get("cookies", []):
+            self._session.cookies.set(
+                c["name"], c["value"],
+                domain=c.get("domain", ""), path=c.get("path", "/"),
+                expires=c.get("expires"), secure=c.get("secure", False),
+            )
+        return self._is_ingelogd()
+
+    def _is_ingelogd(self) -> bool:
+        """
+        Controleer zonder request of de cookie-jar nog een geldige sessie bevat.
+
+        Verlopen cookies worden eerst verwijderd; cookies zonder expiry
+        (sessie-cookies) tellen als geldig. Of de server de sessie nog kent,
+        blijkt pas bij de eerste pagina (zie _laad_spelers_pagina).
+        """
+        self._session.cookies.clear_expired_cookies()
+        return len(self._session.cookies) > 0
+
+    def _bewaar_sessie(self):
+        """Sla de cookies van de huidige sessie op voor een volgende run."""
+        username, _ = self._credentials()
+        data = {
+            "username": username,
+            "cookies": [
+                {
+                    "name": c.name, "value": c.value, "domain": c.domain,
+                    "path": c.path, "expires": c.expires, "secure": c.secure,
+                }
+                for c in self._session.cookies
+            ],
+        }
+        pad = self._sessie_bestand()
+        try:
+            # Alleen leesbaar voor de eigenaar: de cookies geven toegang tot het account
+            fd = os.open(pad, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+        except OSError as e:
+            self._log.debug(f"Sessie opslaan mislukt ({pad}): {e}")
+
+    def _login(self):
+        username, password = self._credentials()
         if not username or not password:
             raise ReserveringError("Geen credentials geconfigureerd")
 
+        # Begin met een schone cookie-jar (eventueel verlopen opgeslagen sessie)
+        self._session.cookies.clear()
+        self._sessie_hergebruikt = False
+
         self._log.info(f"Inloggen als {username}...")
         resp = self._session.post(f"{BASE_URL}/mijn", data={
             "Login.LoginType": "FedmembershipNumber",
@@ -89,25 +269,61 @@ class ApiReserveringBot:
             "Login.Password": password,
         }, allow_redirects=True)
 
-        page_lower = resp.text.lower()
-
         if resp.status_code != 200:
             raise ReserveringError(f"Login mislukt (HTTP {resp.status_code})")
 
         # Detecteer of het login-formulier nog zichtbaar is (= login mislukt)
-        login_form_indicators = ['type="password"', "type='password'", 'login.password']
-        if any(indicator in page_lower for indicator in login_form_indicators):
+        if _LOGIN_FORM_RE.search(resp.text):
             self._log.error(f"Login-formulier nog zichtbaar na POST - credentials incorrect?")
             self._log.debug(f"Response URL: {resp.url}")
             raise ReserveringError("Login mislukt - login-formulier nog zichtbaar (controleer credentials)")
 
-        if len(self._session.cookies) == 0:
+        if not self._is_ingelogd():
             raise ReserveringError("Login mislukt - geen sessie-cookies ontvangen")
 
         self._log.info(f"Login geslaagd ({len(self._session.cookies)} cookies, URL: {resp.url})")
+        self._bewaar_sessie()
+
+    def _laad_spelers_pagina(self) -> requests.Response:
+        """
+        GET de ReservationsPlayers pagina.
+
+        Bij een hergebruikte sessie is dit de eerste echte request. Alleen een
+        herkenbare spelers-pagina (status 200, op ReservationsPlayers, met
+        CSRF-token) bevestigt de sessie; bij al het andere (login-formulier,
+        foutpagina, redirect) is de sessie onbruikbaar en loggen we alsnog in.
+        """
+        resp = self._session.get(f"{BASE_URL}/me/ReservationsPlayers")
+        if self._sessie_hergebruikt:
+            if (
+                resp.status_code == 200
+                and "ReservationsPlayers" in resp.url
+                and _CSRF_RE.search(resp.text)
+            ):
+                self._sessie_hergebruikt = False
+            else:
+                self._log.info(
+                    "Opgeslagen sessie onbruikbaar (status %s, URL: %s), opnieuw inloggen...",
+                    resp.status_code, resp.url,
+                )
+                self._login()
+                resp = self._session.get(f"{BASE_URL}/me/ReservationsPlayers")
+        return resp
+
+    def _dump_html(self, bestandsnaam: str, html: str):
+        """Schrijf een HTML-pagina naar bestand voor diagnose (alleen bij debug)."""
+        if not (self._debug_dumps or self._log.isEnabledFor(logging.DEBUG)):
+            return
+        try:
+            dump_path = BASE_DIR / bestandsnaam
+            with open(dump_path, "w", encoding="utf-8") as f:
+                f.write(html)
+            self._log.debug(f"HTML gedumpt naar: {dump_path}")
+        except Exception as e:
+            self._log.debug(f"HTML dump {bestandsnaam} mislukt: {e}")
 
     def _get_csrf(self, html: str) -> str:
-        match = re.search(r'__RequestVerificationToken.*?value="([^"]+)"', html)
+        match = _CSRF_RE.search(html)
         if not match:
             raise ReserveringError("CSRF token niet gevonden")
         return match.group(1)
@@ -124,26 +340,29 @@ class ApiReserveringBot:
           </div>
         """
         guids = {}
-        for m in re.finditer(
-            r'class="card-body\s+addPlayer"[^>]*data-id="([a-f0-9-]+)"[^>]*>(.*?)</div>',
-            html,
-            re.DOTALL,
-        ):
+        for m in _SPELER_CARD_RE.finditer(html):
             guid = m.group(1)
-            inner = re.sub(r'<[^>]+>', ' ', m.group(2))
-            inner = html_mod.unescape(re.sub(r'\s+', ' ', inner).strip())
+            inner = _TAG_RE.sub(' ', m.group(2))
+            inner = html_mod.unescape(_WHITESPACE_RE.sub(' ', inner).strip())
             if inner:
                 guids[inner] = guid
 
         return guids
 
-    def _ontdek_speler_guids(self) -> dict[str, str]:
-        """Parse de ReservationsPlayers pagina om recente speler GUIDs te vinden."""
-        resp = self._session.get(f"{BASE_URL}/me/ReservationsPlayers")
-        if resp.status_code != 200:
-            raise ReserveringError(f"Kon spelers-pagina niet laden (status {resp.status_code})")
+    def _ontdek_speler_guids(self, players_html: str | None = None) -> dict[str, str]:
+        """
+        Parse de ReservationsPlayers pagina om recente speler GUIDs te vinden.
 
-        guids = self._parse_speler_cards(resp.text)
+        Als de pagina al is opgehaald (players_html) wordt die hergebruikt,
+        zodat er geen tweede GET naar dezelfde pagina nodig is.
+        """
+        if players_html is None:
+            resp = self._laad_spelers_pagina()
+            if resp.status_code != 200:
+                raise ReserveringError(f"Kon spelers-pagina niet laden (status {resp.status_code})")
+            players_html = resp.text
+
+        guids = self._parse_speler_cards(players_html)
 
         self._log.info(f"Recente speler GUIDs gevonden: {len(guids)}")
         for naam, guid in guids.items():
@@ -192,14 +411,17 @@ class ApiReserveringBot:
         if not self._speler_guids:
             self._speler_guids = self._ontdek_speler_guids()
 
+        # Namen eenmalig lowercasen voor de achternaam-fallback (niet per speler opnieuw)
+        namen_lower = [(naam.lower(), g) for naam, g in self._speler_guids.items()]
+
         toegevoegd = 0
         for speler in spelers:
             guid = self._speler_guids.get(speler)
             if not guid:
                 # Zoek op achternaam in bekende GUIDs
                 achternaam = speler.split()[-1].lower()
-                for naam, g in self._speler_guids.items():
-                    if achternaam in naam.lower():
+                for naam_lower, g in namen_lower:
+                    if achternaam in naam_lower:
                         guid = g
                         break
 
@@ -211,6 +433,7 @@ class ApiReserveringBot:
                     guid = next(iter(zoek_resultaten.values()))
                     naam = next(iter(zoek_resultaten.keys()))
                     self._speler_guids[naam] = guid
+                    namen_lower.append((naam.lower(), guid))
                     self._log.info(f"Gevonden via search: {naam} ({guid[:8]}...)")
 
             if not guid:
@@ -239,19 +462,15 @@ class ApiReserveringBot:
         self._log.debug(f"ReservationsPlayersPost -> status {resp.status_code}, URL: {resp.url}")
         if resp.status_code != 200:
             raise ReserveringError(f"Spelers submiten mislukt (status {resp.status_code})")
-        self._log.info(f"Spelers ingediend, naar dag-selectie (URL: {resp.url})")
+        self._log.info("Spelers ingediend, naar dag-selectie (URL: %s)", resp.url)
+        if "ReservationsDay" in resp.url:
+            self._dag_html = resp.text
         return resp
 
     def _selecteer_dag(self, target_date: date, tijden: list[str]) -> str:
         """Selecteer dag + dagdeel en return de HTML van de baan-pagina."""
         eerste_tijd = tijden[0] if tijden else "19:00"
-        uur = int(eerste_tijd.split(":")[0])
-        if uur < 12:
-            dagdeel_uur = 8
-        elif uur < 17:
-            dagdeel_uur = 12
-        else:
-            dagdeel_uur = 18
+        dagdeel_uur = _DAGDEEL_UUR[int(eerste_tijd.split(":")[0])]
 
         # Construeer TZ-aware datetime via constructor (niet replace()) voor DST-safety
         if isinstance(target_date, date) and not isinstance(target_date, datetime):
@@ -269,12 +488,16 @@ class ApiReserveringBot:
 
         selected_date = target_date.strftime("%Y-%m-%d") + dagdeel_suffix
 
-        # Haal CSRF token van de ReservationsDay pagina
-        day_page = self._session.get(f"{BASE_URL}/me/ReservationsDay")
-        self._log.debug(f"ReservationsDay GET -> status {day_page.status_code}, URL: {day_page.url}")
-        csrf = self._get_csrf(day_page.text)
+        # Haal CSRF token van de ReservationsDay pagina. Direct na het submitten
+        # van de spelers hebben we die pagina al (redirect), dan geen extra GET.
+        day_html, self._dag_html = self._dag_html, None
+        if day_html is None or not _CSRF_RE.search(day_html):
+            day_page = self._session.get(f"{BASE_URL}/me/ReservationsDay")
+            self._log.debug("ReservationsDay GET -> status %s, URL: %s", day_page.status_code, day_page.url)
+            day_html = day_page.text
+        csrf = self._get_csrf(day_html)
 
-        self._log.info(f"Selecteer dag: {selected_date}")
+        self._log.info("Selecteer dag: %s", selected_date)
         resp = self._session.post(
             f"{BASE_URL}/me/ReservationsDay",
             data={
@@ -284,7 +507,7 @@ class ApiReserveringBot:
             allow_redirects=True,
         )
 
-        self._log.debug(f"ReservationsDay POST -> status {resp.status_code}, URL: {resp.url}")
+        self._log.debug("ReservationsDay POST -> status %s, URL: %s", resp.status_code, resp.url)
 
         if resp.status_code != 200 or "ReservationsCourt" not in resp.url:
             self._log.error(f"Dag selectie response body (500 chars): {resp.text[:500]}")
@@ -292,17 +515,13 @@ class ApiReserveringBot:
                 f"Dag selectie mislukt (status {resp.status_code}, url={resp.url})"
             )
 
-        self._log.info(f"Dag geselecteerd, op baan-pagina (URL: {resp.url})")
+        self._log.info("Dag geselecteerd, op baan-pagina (URL: %s)", resp.url)
 
-        # Dump court HTML voor diagnose
-        try:
-            from pathlib import Path
-            dump_path = Path(__file__).parent / "court_dump.html"
-            with open(dump_path, "w", encoding="utf-8") as f:
-                f.write(resp.text)
-            self._log.debug(f"Court HTML gedumpt naar: {dump_path}")
-        except Exception as e:
-            self._log.debug(f"Court HTML dump mislukt: {e}")
+        # Dump court HTML voor diagnose; in de retry-loop alleen de eerste keer,
+        # daarna alleen de pagina waarop daadwerkelijk geboekt wordt
+        if not self._court_gedumpt:
+            self._dump_html("court_dump.html", resp.text)
+            self._court_gedumpt = True
 
         return resp.text
 
@@ -323,10 +542,15 @@ class ApiReserveringBot:
         disabled_count = 0
         empty_count = 0
 
-        for tic_match in re.finditer(
-            r'<div\b[^>]*class="([^"]*\btimeincourt\b[^"]*)"[^>]*>(.*?)</div>',
-            court_html, re.DOTALL,
-        ):
+        # Begin pas bij het eerste timeincourt-blok: header, navigatie en
+        # scripts ervoor hoeven niet door de (dure) div-regex gescand te worden.
+        grid_start = court_html.find("timeincourt")
+        if grid_start == -1:
+            grid_start = len(court_html)
+        else:
+            grid_start = max(court_html.rfind("<div", 0, grid_start), 0)
+
+        for tic_match in _TIMEINCOURT_RE.finditer(court_html, grid_start):
             tic_classes = tic_match.group(1)
             tic_inner = tic_match.group(2)
 
@@ -334,10 +558,7 @@ class ApiReserveringBot:
                 disabled_count += 1
                 continue
 
-            select_match = re.search(
-                r'<select\b([^>]*)data-court="([a-f0-9-]+)"([^>]*)>(.*?)</select>',
-                tic_inner, re.DOTALL,
-            )
+            select_match = _SELECT_RE.search(tic_inner)
             if not select_match:
                 continue
 
@@ -354,18 +575,18 @@ class ApiReserveringBot:
                 continue
 
             options_found = False
-            for opt_match in re.finditer(r'<option\b([^>]*)>([^<]*)</option>', select_inner):
+            for opt_match in _OPTION_RE.finditer(select_inner):
                 opt_attrs = opt_match.group(1)
 
-                value_m = re.search(r'value="([^"]+)"', opt_attrs)
-                end_m = re.search(r'data-end-?time="([^"]+)"', opt_attrs)
+                value_m = _OPTION_VALUE_RE.search(opt_attrs)
+                end_m = _OPTION_END_RE.search(opt_attrs)
                 if not value_m or not end_m:
                     continue
 
                 start_full = value_m.group(1).strip()
                 end_full = end_m.group(1).strip()
-                start_short = re.search(r'(\d{2}:\d{2})', start_full)
-                end_short = re.search(r'(\d{2}:\d{2})', end_full)
+                start_short = _HHMM_RE.search(start_full)
+                end_short = _HHMM_RE.search(end_full)
 
                 if start_short and end_short:
                     options_found = True
@@ -375,7 +596,6 @@ class ApiReserveringBot:
                         "start_full": start_full,
                         "end_full": end_full,
                         "start_time": start_short.group(1),
-                        "end_time": end_full,
                         "end_time_short": end_short.group(1),
                     })
 
@@ -383,20 +603,19 @@ class ApiReserveringBot:
                 empty_count += 1
 
         self._log.info(
-            f"Beschikbare padel-slots: {len(slots)} "
-            f"(disabled: {disabled_count}, leeg: {empty_count})"
+            "Beschikbare padel-slots: %d (disabled: %d, leeg: %d)",
+            len(slots), disabled_count, empty_count,
         )
 
         if len(slots) == 0:
-            all_tic_tags = re.findall(r'<[^>]*\btimeincourt\b[^>]*>', court_html)
+            all_tic_tags = _TIMEINCOURT_TAG_RE.findall(court_html)
             self._log.warning(
-                f"0 beschikbare slots "
-                f"(disabled: {disabled_count}, leeg: {empty_count}, "
-                f"totaal timeincourt: {len(all_tic_tags)})"
+                "0 beschikbare slots (disabled: %d, leeg: %d, totaal timeincourt: %d)",
+                disabled_count, empty_count, len(all_tic_tags),
             )
 
         for s in slots:
-            self._log.debug(f"  {s['court_name']} {s['start_time']}-{s['end_time_short']}")
+            self._log.debug("  %s %s-%s", s["court_name"], s["start_time"], s["end_time_short"])
         return slots
 
     def _vind_beste_slot(
@@ -411,26 +630,26 @@ class ApiReserveringBot:
         if not slots:
             return None
 
+        # Indexeer de slots eenmalig op (baan, starttijd); eerste voorkomen wint
+        slot_index: dict[tuple[str, str], dict] = {}
+        for s in slots:
+            slot_index.setdefault((s["court_guid"], s["start_time"]), s)
+
         for gewenste_tijd in tijden:
             for baan_nr in (baan_voorkeur or [1, 2, 3, 4]):
                 court_guid = PADEL_COURTS.get(baan_nr)
                 if not court_guid:
                     continue
 
-                matching = [
-                    s for s in slots
-                    if s["court_guid"] == court_guid and s["start_time"] == gewenste_tijd
-                ]
-
-                if matching:
-                    slot = matching[0]
+                slot = slot_index.get((court_guid, gewenste_tijd))
+                if slot:
                     self._log.info(
-                        f"Beste slot: {slot['start_time']}-{slot['end_time_short']} "
-                        f"op {slot['court_name']}"
+                        "Beste slot: %s-%s op %s",
+                        slot["start_time"], slot["end_time_short"], slot["court_name"],
                     )
                     return slot
 
-            self._log.debug(f"Tijd {gewenste_tijd} niet beschikbaar op voorkeursbanen")
+            self._log.debug("Tijd %s niet beschikbaar op voorkeursbanen", gewenste_tijd)
 
         self._log.warning("Geen geschikt slot gevonden voor gewenste tijden")
         return None
@@ -440,8 +659,8 @@ class ApiReserveringBot:
         csrf = self._get_csrf(court_html)
 
         self._log.info(
-            f"Reserveer {slot['court_name']} van {slot['start_time']} "
-            f"({slot['start_full']} - {slot['end_full']})"
+            "Reserveer %s van %s (%s - %s)",
+            slot["court_name"], slot["start_time"], slot["start_full"], slot["end_full"],
         )
 
         if dry_run:
@@ -459,7 +678,7 @@ class ApiReserveringBot:
             allow_redirects=True,
         )
 
-        self._log.debug(f"ReservationsCourt POST -> status {resp.status_code}, URL: {resp.url}")
+        self._log.debug("ReservationsCourt POST -> status %s, URL: %s", resp.status_code, resp.url)
 
         if resp.status_code != 200:
             return (False, f"Court selectie mislukt (status {resp.status_code})")
@@ -469,29 +688,20 @@ class ApiReserveringBot:
             return self._bevestig_reservering(resp.text)
 
         # Misschien is het direct bevestigd
-        page_text = resp.text.lower()
-        success_indicators = [
-            "reservering geplaatst", "reservering bevestigd",
-            "succesvol gereserveerd", "gelukt", "bevestigd",
-        ]
-        for indicator in success_indicators:
-            if indicator in page_text:
-                return (True, f"Reservering bevestigd ({indicator})")
-
-        error_patterns = [
-            "heeft al een reservering", "maximaal", "bezet",
-            "niet beschikbaar", "er is een fout", "fout opgetreden",
-            "an error occurred", "server error",
-        ]
-        for pattern in error_patterns:
-            if pattern in page_text:
-                return (False, f"Fout: {pattern}")
+        page_text = resp.text
+        indicator = _zoek_indicator(page_text, _SUCCES_INDICATOREN, _SUCCES_RE)
+        if indicator:
+            return (True, f"Reservering bevestigd ({indicator})")
+
+        pattern = _zoek_indicator(page_text, _COURT_FOUT_INDICATOREN, _COURT_FOUT_RE)
+        if pattern:
+            return (False, f"Fout: {pattern}")
 
         # Als we nog op de Court pagina zijn, is er iets misgegaan
         if "ReservationsCourt" in resp.url:
             return (False, "Baan selectie niet geaccepteerd - mogelijk al bezet")
 
-        self._log.warning(f"Onbekende status na court POST. URL: {resp.url}")
+        self._log.warning("Onbekende status na court POST. URL: %s", resp.url)
         return (False, "Onbekende status - controleer handmatig")
 
     def _bevestig_reservering(self, confirm_html: str) -> tuple[bool, str]:
@@ -505,27 +715,19 @@ class ApiReserveringBot:
         self._log.info("Bevestigingspagina bereikt, bevestig reservering...")
 
         # Dump confirm HTML voor diagnose
-        try:
-            from pathlib import Path
-            dump_path = Path(__file__).parent / "confirm_dump.html"
-            with open(dump_path, "w", encoding="utf-8") as f:
-                f.write(confirm_html)
-            self._log.debug(f"Confirm HTML gedumpt naar: {dump_path}")
-        except Exception as e:
-            self._log.debug(f"Confirm HTML dump mislukt: {e}")
-
-        # Zoek de AJAX save-URL uit de confirm-button
-        save_match = re.search(
-            r'id="confirmReservationButton"[^>]*data-url="([^"]+)"', confirm_html
+        self._dump_html("confirm_dump.html", confirm_html)
+
+        # Zoek de AJAX save-URL in één pass; de confirm-button gaat voor
+        kandidaten = _SAVE_URL_RE.findall(confirm_html)
+        save_url = (
+            next((knop for knop, _ in kandidaten if knop), None)
+            or next((url for _, url in kandidaten if url), None)
+            or "/Ajax/Profile/SaveReservation"
         )
-        if not save_match:
-            save_match = re.search(r'data-url="(/Ajax/Profile/SaveReservation[^"]*)"', confirm_html)
-
-        save_url = save_match.group(1) if save_match else "/Ajax/Profile/SaveReservation"
         if save_url.startswith("/"):
             save_url = f"{BASE_URL}{save_url}"
 
-        self._log.info(f"AJAX bevestiging via: {save_url}")
+        self._log.info("AJAX bevestiging via: %s", save_url)
 
         resp = self._session.post(
             save_url,
@@ -534,19 +736,14 @@ class ApiReserveringBot:
         )
 
         self._log.debug(
-            f"SaveReservation -> status {resp.status_code}, "
-            f"URL: {resp.url}, body: {resp.text[:300]}"
+            "SaveReservation -> status %s, URL: %s, body: %.300s",
+            resp.status_code, resp.url, resp.text,
         )
 
         if resp.status_code == 200:
-            body = resp.text.strip().lower()
-            error_patterns = [
-                "heeft al een reservering", "maximaal", "niet beschikbaar",
-                "er is een fout", "fout opgetreden", "server error",
-            ]
-            for pattern in error_patterns:
-                if pattern in body:
-                    return (False, f"Bevestiging mislukt: {pattern}")
+            pattern = _zoek_indicator(resp.text, _BEVESTIG_FOUT_INDICATOREN, _BEVESTIG_FOUT_RE)
+            if pattern:
+                return (False, f"Bevestiging mislukt: {pattern}")
 
             self._log.info("SaveReservation OK (status 200)")
             return (True, "Reservering bevestigd via AJAX")
@@ -565,7 +762,7 @@ class ApiReserveringBot:
         Returns:
             Dict van {naam: guid} voor alle beschikbare spelers.
         """
-        self._session.get(f"{BASE_URL}/me/ReservationsPlayers")
+        self._laad_spelers_pagina()
         return self._zoek_alle_spelers()
 
     # =========================================================================
@@ -584,7 +781,7 @@ class ApiReserveringBot:
         """
         try:
             # Laad spelers-pagina en voeg spelers toe
-            players_page = self._session.get(f"{BASE_URL}/me/ReservationsPlayers")
+            players_page = self._laad_spelers_pagina()
             self._log.debug(
                 f"ReservationsPlayers GET -> status {players_page.status_code}, "
                 f"URL: {players_page.url}"
@@ -593,13 +790,15 @@ class ApiReserveringBot:
                 return f"Kon spelers-pagina niet laden (status {players_page.status_code})"
 
             # Detecteer redirect naar login (= sessie verlopen)
-            if 'type="password"' in players_page.text.lower():
+            if _LOGIN_FORM_RE.search(players_page.text):
                 return "Sessie verlopen - login-pagina getoond i.p.v. spelers-pagina"
 
             csrf = self._get_csrf(players_page.text)
 
-            # Ontdek speler GUIDs
-            self._speler_guids = self._ontdek_speler_guids()
+            # Ontdek speler GUIDs uit de al geladen pagina. Bij een retry is de
+            # mapping (incl. via search gevonden spelers) al bekend.
+            if not self._speler_guids:
+                self._speler_guids = self._ontdek_speler_guids(players_page.text)
 
             toegevoegd = self._voeg_spelers_toe(spelers)
             if toegevoegd == 0:
@@ -609,6 +808,7 @@ class ApiReserveringBot:
 
             # Submit spelers
             self._submit_spelers(csrf)
+            self._wizard_op_dagstap = True
             return None
 
         except ReserveringError as e:
@@ -618,6 +818,30 @@ class ApiReserveringBot:
         except Exception as e:
             return f"Onverwachte fout bij voorbereiding: {e}"
 
+    def voorverwarmen(self, timeout: float = HTTP_TIMEOUT):
+        """
+        Haal de dag-selectiepagina vlak voor het venster opnieuw op.
+
+        Tussen voorbereiding en venster zitten enkele minuten; in die tijd kan
+        de server de keep-alive verbinding sluiten. Deze GET houdt de verbinding
+        open (geen nieuwe TCP/TLS-handshake bij de eerste poging) en levert een
+        vers CSRF-token, zodat de eerste poging direct de dag kan POSTen.
+        Fouten zijn niet fataal: de eerste poging doet dan zelf de GET.
+
+        Args:
+            timeout: Timeout voor de GET (connect en read afzonderlijk); kort
+                houden zodat een trage server de eerste poging niet vertraagt.
+        """
+        if not self._wizard_op_dagstap:
+            return
+        try:
+            resp = self._session.get(f"{BASE_URL}/me/ReservationsDay", timeout=timeout)
+            self._log.debug("ReservationsDay GET (voorverwarmen) -> status %s", resp.status_code)
+            if resp.status_code == 200 and "ReservationsDay" in resp.url:
+                self._dag_html = resp.text
+        except Exception as e:
+            self._log.debug("Voorverwarmen mislukt: %s", e)
+
     def probeer_reserveer(
         self,
         target_date: date,
@@ -642,15 +866,22 @@ class ApiReserveringBot:
         }
 
         try:
-            if not is_eerste_poging:
+            if not is_eerste_poging and not self._wizard_op_dagstap:
                 # Herstart wizard: spelers opnieuw toevoegen
                 fout = self.voorbereiden(target_date, tijden, spelers)
                 if fout:
                     result["foutmelding"] = fout
                     result["retry"] = True
                     return result
+            elif not is_eerste_poging:
+                self._log.debug("Wizard staat nog op dag-selectie, alleen beschikbaarheid opnieuw ophalen")
+
+            # Na een fout of een court-POST is de wizard-stand onbekend;
+            # alleen als er geen slot te boeken viel blijft de dag-stap herbruikbaar.
+            self._wizard_op_dagstap = False
 
-            # Selecteer dag
+            # Selecteer dag (dumpt de baan-pagina alleen bij de eerste poging)
+            court_al_gedumpt = self._court_gedumpt
             court_html = self._selecteer_dag(target_date, tijden)
 
             # Parse beschikbare slots
@@ -659,6 +890,7 @@ class ApiReserveringBot:
                 self._laatste_fout = "Geen beschikbare padel-slots gevonden"
                 result["foutmelding"] = self._laatste_fout
                 result["retry"] = True
+                self._wizard_op_dagstap = True
                 return result
 
             # Vind beste slot
@@ -671,6 +903,7 @@ class ApiReserveringBot:
                 )
                 result["foutmelding"] = self._laatste_fout
                 result["retry"] = True
+                self._wizard_op_dagstap = True
                 return result
 
             result["tijd"] = slot["start_time"]
@@ -678,14 +911,20 @@ class ApiReserveringBot:
 
             # Reserveer
             succes, detail = self._reserveer_baan(court_html, slot, dry_run)
+
+            # Dump de pagina waarop geboekt is pas na de court-POST (schrijven
+            # naar schijf hoort niet in het tijdkritieke pad), en niet dubbel
+            # als _selecteer_dag hem deze poging al gedumpt heeft
+            if court_al_gedumpt:
+                self._dump_html("court_dump.html", court_html)
             if succes:
                 result["success"] = True
                 result["foutmelding"] = detail if dry_run else None
             else:
                 result["foutmelding"] = detail
-                fout_lower = detail.lower()
-                no_retry = ["heeft al een reservering", "maximaal", "niet toegestaan"]
-                result["retry"] = not any(ind in fout_lower for ind in no_retry)
+                result["retry"] = not _zoek_indicator(
+                    detail, _DEFINITIEVE_FOUT_INDICATOREN, _DEFINITIEVE_FOUT_RE,
+                )
 
         except ReserveringError as e:
             result["foutmelding"] = str(e)
@@ -693,11 +932,11 @@ class ApiReserveringBot:
         except (requests.Timeout, requests.ConnectionError) as e:
             result["foutmelding"] = f"Verbindingsfout: {e}"
             result["retry"] = True
-            self._log.warning(f"HTTP timeout/verbindingsfout: {e}")
+            self._log.warning("HTTP timeout/verbindingsfout: %s", e)
         except Exception as e:
             result["foutmelding"] = f"Fout: {e}"
             result["retry"] = True
-            self._log.error(f"Fout bij reserveerpoging: {e}", exc_info=True)
+            self._log.error("Fout bij reserveerpoging: %s", e, exc_info=True)
 
         return result
 
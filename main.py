@@ -10,8 +10,14 @@ Gebruik:
 """
 
 import argparse
+import functools
 import json
 import logging
+import logging.handlers
+import math
+import os
+import random
+import signal
 import sys
 import threading
 import time
@@ -22,6 +28,12 @@ from zoneinfo import ZoneInfo
 
 import yaml
 
+# LibYAML C-parser indien beschikbaar; de pure-Python SafeLoader is veel trager
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 from api_bot import ApiReserveringBot, ReserveringError
 from notifier import EmailNotifier
 
@@ -33,6 +45,11 @@ NL_TZ = ZoneInfo("Europe/Amsterdam")
 
 # Logging configuratie
 LOG_FILE = BASE_DIR / "reservering.log"
+LOG_BUFFER_CAPACITEIT = 200  # Logregels die gebufferd worden voor ze naar het bestand gaan
+
+# Geparste config.yaml als JSON; laden is veel sneller dan YAML parsen.
+# Bevat de st_mtime_ns van config.yaml waarvan de cache is gemaakt.
+CONFIG_CACHE_FILE = BASE_DIR / ".config.cache.json"
 
 DAGNAMEN = {
     0: "maandag",
@@ -45,9 +62,42 @@ DAGNAMEN = {
 }
 
 # Timing configuratie
-RETRY_INTERVAL_SEC = 10     # Seconden tussen pogingen
+RETRY_INTERVAL_MIN_SEC = 2  # Seconden tussen pogingen direct na het openen van het venster
+RETRY_INTERVAL_MAX_SEC = 30 # Maximale wachttijd tussen pogingen
+RETRY_KRAP_POGINGEN = 10    # Aantal pogingen met het minimale interval
+RETRY_BACKOFF = 1.3         # Groeifactor van het interval daarna
+RETRY_JITTER_SEC = 1.0      # Willekeurige extra wachttijd (0..N s) per poging
+
+# Gezet door de SIGTERM-handler (bijv. bij afsluiten van de Pi): alle wachttijden
+# en retry-loops breken direct af zodat de sessies netjes worden gesloten
+STOP_SIGNAAL = threading.Event()
+# Aantal lopende reserveer_met_retry-aanroepen (die reageren op STOP_SIGNAAL)
+_retry_loops_actief = 0
+_retry_loops_lock = threading.Lock()
 VOORBEREIDING_MIN = 3       # Minuten voor de 48u-grens dat we inloggen en spelers selecteren
 NA_VENSTER_MAX_MIN = 15     # Minuten na het 48u-venster dat we blijven proberen
+VOORVERWARM_SEC = 5         # Seconden voor het venster dat de HTTP-verbinding wordt opgewarmd
+VOORVERWARM_MIN_SEC = 2     # Minder tijd over tot het venster: niet meer opwarmen
+WACHT_STAART_SEC = 2.0      # Laatste seconden voor een doel-tijdstip: kort pollen i.p.v. slapen
+WACHT_POLL_SEC = 0.001      # Poll-interval in die staart
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_tijd(tijd: str) -> tuple[int, int] | None:
+    """
+    Parse een "HH:MM" tijd uit de config naar (uur, minuut).
+
+    Gememoized: de config bevat maar een handvol tijden, die bij elke
+    dag-scan en retry opnieuw worden opgevraagd.
+
+    Returns:
+        (uur, minuut), of None als de tijd ongeldig is.
+    """
+    try:
+        uur, minuut = map(int, tijd.split(":"))
+    except ValueError:
+        return None
+    return uur, minuut
 
 
 def setup_logging(verbose: bool = False):
@@ -62,11 +112,16 @@ def setup_logging(verbose: bool = False):
     root_logger = logging.getLogger()
     root_logger.setLevel(log_level)
 
-    # Bestandshandler
-    file_handler = logging.FileHandler(LOG_FILE, encoding="utf-8")
+    # Bestandshandler, gebufferd: regels gaan per batch naar schijf (of direct
+    # bij een WARNING of erger) i.p.v. een write per regel tijdens de wachtfases
+    file_handler = logging.FileHandler(LOG_FILE, encoding="utf-8", delay=True)
     file_handler.setLevel(logging.DEBUG)
     file_handler.setFormatter(formatter)
-    root_logger.addHandler(file_handler)
+    buffer_handler = logging.handlers.MemoryHandler(
+        capacity=LOG_BUFFER_CAPACITEIT, flushLevel=logging.WARNING, target=file_handler,
+    )
+    buffer_handler.setLevel(logging.DEBUG)
+    root_logger.addHandler(buffer_handler)
 
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
@@ -75,18 +130,105 @@ def setup_logging(verbose: bool = False):
     root_logger.addHandler(console_handler)
 
 
+def installeer_sigterm_handler():
+    """
+    Laat SIGTERM de retry-modus netjes afbreken.
+
+    Loopt er een reserveer_met_retry (wachtfase of retry-loop), dan zet de
+    eerste SIGTERM het STOP_SIGNAAL zodat die stopt en de sessie sluit. Een
+    SIGTERM zonder lopende retry-loop, of een tweede SIGTERM, beëindigt het
+    proces zoals zonder deze handler (standaardgedrag).
+
+    Geen Python signal-handler: die draait op de main thread, en
+    STOP_SIGNAAL.set() pakt dezelfde lock die de main thread in
+    STOP_SIGNAAL.wait() vasthoudt (deadlock). In plaats daarvan wordt SIGTERM
+    geblokkeerd en wacht een aparte thread er met sigwait() op. Moet worden
+    aangeroepen voordat er andere threads starten, zodat die het signaalmasker
+    erven. Op platforms zonder pthread_sigmask (Windows) blijft het
+    standaardgedrag.
+    """
+    if not hasattr(signal, "pthread_sigmask"):
+        return
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.pthread_sigmask(signal.SIG_BLOCK, {signal.SIGTERM})
+
+    def _wacht_op_sigterm():
+        signal.sigwait({signal.SIGTERM})
+        with _retry_loops_lock:
+            actief = _retry_loops_actief
+        if actief:
+            logging.getLogger(__name__).warning(
+                "SIGTERM ontvangen - reservering wordt afgebroken "
+                "(nogmaals SIGTERM = direct stoppen)"
+            )
+            STOP_SIGNAAL.set()
+            signal.sigwait({signal.SIGTERM})
+
+        # Standaardgedrag: deblokkeer in deze thread en stuur het signaal opnieuw
+        flush_logs()
+        signal.pthread_sigmask(signal.SIG_UNBLOCK, {signal.SIGTERM})
+        signal.raise_signal(signal.SIGTERM)
+
+    threading.Thread(target=_wacht_op_sigterm, name="sigterm", daemon=True).start()
+
+
+def flush_logs():
+    """Schrijf gebufferde logregels direct naar het logbestand."""
+    for handler in logging.getLogger().handlers:
+        handler.flush()
+
+
 def load_config() -> dict:
     """Laad de configuratie uit config.yaml."""
     config_path = BASE_DIR / "config.yaml"
     if not config_path.exists():
         raise FileNotFoundError(f"Configuratiebestand niet gevonden: {config_path}")
 
+    # Snelle route: JSON-cache van precies deze versie van config.yaml. Exacte
+    # vergelijking (niet >=), zodat ook een teruggezette oudere config.yaml
+    # (bijv. git checkout) opnieuw geparsed wordt.
+    bron_mtime_ns = config_path.stat().st_mtime_ns
+    try:
+        with open(CONFIG_CACHE_FILE, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+        if isinstance(cache, dict) and cache.get("bron_mtime_ns") == bron_mtime_ns:
+            return cache["config"]
+    except (OSError, ValueError, KeyError):
+        pass
+
+    if not yaml.__with_libyaml__:
+        logging.getLogger(__name__).warning(
+            "PyYAML zonder LibYAML - config.yaml wordt met de trage Python-parser "
+            "geladen (installeer libyaml-dev en herinstalleer pyyaml)"
+        )
     with open(config_path, "r", encoding="utf-8") as f:
-        config = yaml.safe_load(f)
+        config = yaml.load(f, Loader=_YamlLoader)
 
+    _bewaar_config_cache(config, bron_mtime_ns)
     return config
 
 
+def _bewaar_config_cache(config: dict, bron_mtime_ns: int):
+    """
+    Schrijf de geparste config als JSON-cache. Alleen als de config zonder
+    verlies naar JSON kan (geen datums, geen niet-string keys); anders
+    wordt er simpelweg niet gecached.
+
+    Atomisch via een tijdelijk bestand + os.replace, zodat een parallel
+    gestarte run (cron + handmatig) nooit een half geschreven cache leest.
+    """
+    tmp_pad = CONFIG_CACHE_FILE.with_name(f"{CONFIG_CACHE_FILE.name}.{os.getpid()}.tmp")
+    try:
+        data = json.dumps({"bron_mtime_ns": bron_mtime_ns, "config": config}, ensure_ascii=False)
+        if json.loads(data)["config"] != config:
+            return
+        tmp_pad.write_text(data, encoding="utf-8")
+        os.replace(tmp_pad, CONFIG_CACHE_FILE)
+    except (TypeError, ValueError, OSError) as e:
+        logging.getLogger(__name__).debug("Config-cache niet geschreven: %s", e)
+        tmp_pad.unlink(missing_ok=True)
+
+
 def vind_reserveerbare_dagen(config: dict) -> list[dict]:
     """
     Vind alle geconfigureerde dagen waarvan de eerstvolgende datum
@@ -101,29 +243,34 @@ def vind_reserveerbare_dagen(config: dict) -> list[dict]:
     """
     logger = logging.getLogger(__name__)
     nu = datetime.now(NL_TZ)
-    uren_vooruit = config.get("reservering", {}).get("uren_vooruit", 48)
-    dagen_config = config.get("reservering", {}).get("dagen", [])
+    reservering_config = config.get("reservering", {})
+    uren_vooruit = reservering_config.get("uren_vooruit", 48)
+    dagen_config = reservering_config.get("dagen", [])
     reserveerbaar = []
+    # strftime() pas aanroepen als de regel ook echt gelogd wordt
+    log_info = logger.isEnabledFor(logging.INFO)
 
-    logger.info(f"Zoek reserveerbare dagen - huidig tijdstip: {nu.strftime('%A %d-%m-%Y %H:%M %Z')}")
+    if log_info:
+        logger.info("Zoek reserveerbare dagen - huidig tijdstip: %s",
+                    nu.strftime("%A %d-%m-%Y %H:%M %Z"))
 
     for dag_config in dagen_config:
         dag = dag_config["dag"]
-        dagnaam = DAGNAMEN.get(dag, str(dag))
-        target = bereken_target_datum(dag_config, uren_vooruit)
+        target = bereken_target_datum(dag_config, uren_vooruit, nu=nu)
 
         if target is not None:
-            eerste_tijd = dag_config.get("tijden", ["19:00"])[0]
-            logger.info(f"  {dagnaam} {target.strftime('%d-%m-%Y')} {eerste_tijd} -> RESERVEERBAAR")
+            if log_info:
+                logger.info("  %s %s %s -> RESERVEERBAAR", DAGNAMEN.get(dag, dag),
+                            target.strftime("%d-%m-%Y"), dag_config.get("tijden", ["19:00"])[0])
             reserveerbaar.append(dag_config)
         else:
-            logger.debug(f"  {dagnaam} -> buiten 48u venster")
+            logger.debug("  %s -> buiten 48u venster", DAGNAMEN.get(dag, dag))
 
-    logger.info(f"Gevonden: {len(reserveerbaar)} reserveerbare dag(en)")
+    logger.info("Gevonden: %d reserveerbare dag(en)", len(reserveerbaar))
     return reserveerbaar
 
 
-def bereken_target_datum(dag_config: dict, uren_vooruit: int) -> date | None:
+def bereken_target_datum(dag_config: dict, uren_vooruit: int, nu: datetime | None = None) -> date | None:
     """
     Bereken de eerstvolgende datum voor een gewenste dag.
 
@@ -131,45 +278,41 @@ def bereken_target_datum(dag_config: dict, uren_vooruit: int) -> date | None:
     datetime.replace() te voorkomen. Timezone-aware datetimes worden
     pas later geconstrueerd via datetime(..., tzinfo=NL_TZ).
 
+    Args:
+        nu: Optioneel huidig tijdstip (NL_TZ), zodat een aanroeper die meerdere
+            dagen doorloopt één consistent moment gebruikt.
+
     Returns:
         De target datum als date, of None als buiten de reserveringsperiode.
     """
-    nu = datetime.now(NL_TZ)
+    if nu is None:
+        nu = datetime.now(NL_TZ)
     vandaag_date = nu.date()
     gewenste_dag = dag_config["dag"]
     huidige_dag = vandaag_date.weekday()
 
-    dagen_tot = (gewenste_dag - huidige_dag) % 7
-    if dagen_tot == 0:
-        eerste_tijd = dag_config.get("tijden", ["19:00"])[0]
-        try:
-            uur, minuut = map(int, eerste_tijd.split(":"))
-            if nu.hour > uur or (nu.hour == uur and nu.minute >= minuut):
-                dagen_tot = 7
-        except ValueError:
-            dagen_tot = 7
+    eerste_tijd = dag_config.get("tijden", ["19:00"])[0]
+    tijd = _parse_tijd(eerste_tijd)
+    tijd_geldig = tijd is not None
+    uur, minuut = tijd or (19, 0)
 
-    target_date = vandaag_date + timedelta(days=dagen_tot)
+    # Reken in seconden vanaf middernacht vandaag i.p.v. met datetime/timedelta.
+    # Dit is dezelfde wandkloktijd-vergelijking als tussen twee datetimes met
+    # dezelfde tzinfo, maar zonder objecten aan te maken.
+    nu_sec = nu.hour * 3600 + nu.minute * 60 + nu.second
+    tijd_sec = uur * 3600 + minuut * 60
 
-    # Construeer een correcte TZ-aware datetime voor de acceptatie-check
-    eerste_tijd = dag_config.get("tijden", ["19:00"])[0]
-    try:
-        uur, minuut = map(int, eerste_tijd.split(":"))
-    except (ValueError, IndexError):
-        uur, minuut = 19, 0
-    target_met_tijd = datetime(
-        target_date.year, target_date.month, target_date.day,
-        uur, minuut, tzinfo=NL_TZ,
-    )
+    dagen_tot = (gewenste_dag - huidige_dag) % 7
+    if dagen_tot == 0 and (not tijd_geldig or nu_sec // 60 >= tijd_sec // 60):
+        dagen_tot = 7
 
     # Accepteer targets tot 90 min voorbij de 48u-grens.
     # Ruime marge zodat de bot ook werkt als de cron iets te vroeg triggert
     # (bijv. GHA-vertraging, of config-wijziging zonder cron-update).
-    max_tijdstip = nu + timedelta(hours=uren_vooruit, minutes=90)
-    if target_met_tijd > max_tijdstip:
+    if dagen_tot * 86400 + tijd_sec - nu_sec > (uren_vooruit * 60 + 90) * 60:
         return None
 
-    return target_date
+    return vandaag_date + timedelta(days=dagen_tot)
 
 
 def get_spelers(config: dict, dag: int) -> list[str]:
@@ -210,6 +353,7 @@ def splits_baan_voorkeur(baan_voorkeur: list[int], n_bots: int = 2) -> list[list
     return delen
 
 
+@functools.lru_cache(maxsize=32)
 def bereken_venster_open(target_date: date, eerste_tijd: str, uren_vooruit: int) -> datetime:
     """
     Bereken het exacte moment waarop het reserveringsvenster opengaat.
@@ -218,13 +362,14 @@ def bereken_venster_open(target_date: date, eerste_tijd: str, uren_vooruit: int)
     correcte TZ-aware datetime geconstrueerd via de constructor (geen
     replace()) om DST-problemen te voorkomen.
 
+    Gememoized: hangt niet van de huidige tijd af, en wordt per reservering
+    meerdere keren met dezelfde argumenten aangeroepen (planning, beide
+    wachtfases).
+
     Returns:
         Timezone-aware datetime van het moment waarop het venster opent.
     """
-    try:
-        uur, minuut = map(int, eerste_tijd.split(":"))
-    except ValueError:
-        uur, minuut = 19, 0
+    uur, minuut = _parse_tijd(eerste_tijd) or (19, 0)
 
     if isinstance(target_date, date) and not isinstance(target_date, datetime):
         reservering_dt = datetime(
@@ -238,38 +383,72 @@ def bereken_venster_open(target_date: date, eerste_tijd: str, uren_vooruit: int)
     return reservering_dt - timedelta(hours=uren_vooruit)
 
 
-def _wacht_tot(doel: datetime, label: str):
-    """Wacht in een sleep-loop tot het doel-tijdstip is bereikt."""
+def _retry_interval(poging_nr: int) -> float:
+    """
+    Wachttijd na poging `poging_nr`: krap rond het openen van het venster
+    (dan wordt de baan vergeven), daarna exponentieel oplopend tot
+    RETRY_INTERVAL_MAX_SEC om de server te ontzien. De jitter voorkomt dat
+    parallelle bots in de pas lopen.
+    """
+    extra = max(0, poging_nr - RETRY_KRAP_POGINGEN)
+    interval = min(RETRY_INTERVAL_MAX_SEC, RETRY_INTERVAL_MIN_SEC * RETRY_BACKOFF ** extra)
+    return interval + random.uniform(0, RETRY_JITTER_SEC)
+
+
+def _wacht_tot(doel: datetime, label: str, poll_staart: bool = False) -> bool:
+    """
+    Wacht tot het doel-tijdstip is bereikt.
+
+    De wachttijd wordt eenmalig omgerekend naar een time.monotonic()-deadline
+    (immuun voor klokcorrecties). Er wordt alleen wakker geworden op hele
+    minuten resterend voor een voortgangslog, niet elke paar seconden.
+    Met poll_staart wordt de laatste WACHT_STAART_SEC in stapjes van 1 ms
+    gepolld, zodat we het doel op de milliseconde raken i.p.v. te vertrouwen
+    op één lange sleep. Alleen zinvol voor het openen van het venster.
+
+    Returns:
+        True als het doel bereikt is, False als STOP_SIGNAAL gezet werd.
+    """
     logger = logging.getLogger(__name__)
     nu = datetime.now(NL_TZ)
     wachttijd = (doel - nu).total_seconds()
 
     if wachttijd > 0:
+        deadline = time.monotonic() + wachttijd
+        staart = WACHT_STAART_SEC if poll_staart else 0.0
         logger.info(f"{label} om: {doel.strftime('%H:%M:%S %Z')}")
         logger.info(f"Nog {wachttijd:.0f} seconden wachten ({wachttijd/60:.1f} minuten)...")
 
-        while wachttijd > 0:
-            slaap = min(wachttijd, 10)
-            time.sleep(slaap)
-            nu = datetime.now(NL_TZ)
-            wachttijd = (doel - nu).total_seconds()
-            if wachttijd > 0 and int(wachttijd) % 60 < 11:
-                logger.info(f"Nog {wachttijd:.0f}s tot {label}...")
+        while (resterend := deadline - time.monotonic()) > staart:
+            # Slaap tot de volgende hele minuut resterend (of tot de staart/het doel)
+            volgende_log = max((math.ceil(resterend / 60) - 1) * 60, staart)
+            if STOP_SIGNAAL.wait(resterend - volgende_log):
+                logger.warning("Stop-signaal ontvangen tijdens wachten op %s", label)
+                return False
+            if volgende_log > staart:
+                logger.info("Nog %ds tot %s...", volgende_log, label)
+
+        while poll_staart and time.monotonic() < deadline:
+            if STOP_SIGNAAL.is_set():
+                logger.warning("Stop-signaal ontvangen tijdens wachten op %s", label)
+                return False
+            time.sleep(WACHT_POLL_SEC)
     else:
         logger.info(f"{label} al bereikt (sinds {abs(wachttijd):.0f}s geleden)")
+    return not STOP_SIGNAAL.is_set()
 
 
-def wacht_tot_voorbereiding(target_date: datetime, eerste_tijd: str, uren_vooruit: int):
+def wacht_tot_voorbereiding(target_date: datetime, eerste_tijd: str, uren_vooruit: int) -> bool:
     """Wacht tot VOORBEREIDING_MIN minuten voor het 48u-venster voor login + spelers."""
     venster_open = bereken_venster_open(target_date, eerste_tijd, uren_vooruit)
     start_voorbereiding = venster_open - timedelta(minutes=VOORBEREIDING_MIN)
-    _wacht_tot(start_voorbereiding, "start voorbereiding")
+    return _wacht_tot(start_voorbereiding, "start voorbereiding")
 
 
-def wacht_tot_48u_grens(target_date: datetime, eerste_tijd: str, uren_vooruit: int):
+def wacht_tot_48u_grens(target_date: datetime, eerste_tijd: str, uren_vooruit: int) -> bool:
     """Wacht tot het 48u-reserveringsvenster open is."""
     venster_open = bereken_venster_open(target_date, eerste_tijd, uren_vooruit)
-    _wacht_tot(venster_open, "reserveringsvenster")
+    return _wacht_tot(venster_open, "reserveringsvenster", poll_staart=True)
 
 
 def reserveer_met_retry(
@@ -287,7 +466,7 @@ def reserveer_met_retry(
     Timing:
     1. Wacht tot T-3min (VOORBEREIDING_MIN voor het 48u-venster)
     2. Login + spelers selecteren
-    3. Wacht tot T (48u-venster opent)
+    3. Wacht tot T (48u-venster opent); op T-5s de verbinding opwarmen
     4. Retry-loop tot T+3min (NA_VENSTER_MAX_MIN na het venster)
     5. Stop bij: succes, definitieve fout, stop_event, of deadline
 
@@ -305,8 +484,9 @@ def reserveer_met_retry(
     logger = logging.getLogger(f"{__name__}.{bot_label}" if bot_label else __name__)
     dag = dag_config["dag"]
     tijden = dag_config.get("tijden", ["19:00"])
-    uren_vooruit = config.get("reservering", {}).get("uren_vooruit", 48)
-    baan_voorkeur = baan_voorkeur_override or config.get("reservering", {}).get("baan_voorkeur", [])
+    reservering_config = config.get("reservering", {})
+    uren_vooruit = reservering_config.get("uren_vooruit", 48)
+    baan_voorkeur = baan_voorkeur_override or reservering_config.get("baan_voorkeur", [])
 
     target_date = bereken_target_datum(dag_config, uren_vooruit)
     if target_date is None:
@@ -342,11 +522,17 @@ def reserveer_met_retry(
         "foutmelding": None,
     }
 
+    global _retry_loops_actief
+    with _retry_loops_lock:
+        _retry_loops_actief += 1
+
     bot = ApiReserveringBot(config, label=bot_label)
     try:
         # --- FASE 1: WACHT TOT T-3min ---
         logger.info(f"--- FASE 1{label_str}: Wachten tot voorbereiding ({VOORBEREIDING_MIN} min voor venster) ---")
-        wacht_tot_voorbereiding(target_date, eerste_tijd, uren_vooruit)
+        if not wacht_tot_voorbereiding(target_date, eerste_tijd, uren_vooruit):
+            result["foutmelding"] = f"Afgebroken{label_str}: stop-signaal ontvangen"
+            return result
 
         # --- FASE 2: LOGIN + SPELERS (3 min buffer voor venster) ---
         logger.info(f"--- FASE 2{label_str}: Voorbereiding (login + spelers) ---")
@@ -362,20 +548,42 @@ def reserveer_met_retry(
 
         # --- FASE 3: WACHT OP 48U-GRENS ---
         logger.info(f"--- FASE 3{label_str}: Wachten op reserveringsvenster ---")
-        wacht_tot_48u_grens(target_date, eerste_tijd, uren_vooruit)
+        venster_bereikt = _wacht_tot(
+            venster_open - timedelta(seconds=VOORVERWARM_SEC), "opwarmen verbinding",
+        )
+        if venster_bereikt:
+            # Opwarmen mag de eerste poging niet vertragen: alleen als er nog tijd
+            # is, en met een timeout (connect + read) die ruim voor T afloopt
+            resterend = (venster_open - datetime.now(NL_TZ)).total_seconds()
+            if resterend > VOORVERWARM_MIN_SEC:
+                bot.voorverwarmen(timeout=(resterend - 1) / 2)
+            venster_bereikt = wacht_tot_48u_grens(target_date, eerste_tijd, uren_vooruit)
+        if not venster_bereikt:
+            result["foutmelding"] = f"Afgebroken{label_str}: stop-signaal ontvangen"
+            return result
 
         # --- FASE 4: RETRY-LOOP (tot absolute deadline T+3min) ---
         logger.info(f"--- FASE 4{label_str}: Retry-loop tot {deadline.strftime('%H:%M:%S')} ---")
         poging_nr = 0
+        # Eenmalig omrekenen naar een monotone deadline: goedkoper per iteratie
+        # en immuun voor klokcorrecties (NTP) tijdens de retry-loop
+        deadline_mono = time.monotonic() + (deadline - datetime.now(NL_TZ)).total_seconds()
 
-        while datetime.now(NL_TZ) < deadline:
+        while time.monotonic() < deadline_mono:
             if stop_event and stop_event.is_set():
-                logger.info(f"Stop-signaal ontvangen{label_str} - andere bot was succesvol")
+                logger.info("Stop-signaal ontvangen%s - andere bot was succesvol", label_str)
                 result["foutmelding"] = "Gestopt: andere bot heeft al gereserveerd"
                 return result
+            if STOP_SIGNAAL.is_set():
+                logger.warning("Stop-signaal ontvangen%s - retry-loop afgebroken", label_str)
+                result["foutmelding"] = f"Afgebroken{label_str}: stop-signaal ontvangen"
+                return result
 
             poging_nr += 1
-            logger.info(f"--- Poging {poging_nr}{label_str} ({datetime.now(NL_TZ).strftime('%H:%M:%S')}) ---")
+            # Wandkloktijd alleen voor de logregel, en alleen als die ook gelogd wordt
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("--- Poging %d%s (%s) ---", poging_nr, label_str,
+                            datetime.now(NL_TZ).strftime("%H:%M:%S"))
 
             poging = bot.probeer_reserveer(
                 target_date, tijden, spelers, baan_voorkeur, dry_run,
@@ -387,25 +595,26 @@ def reserveer_met_retry(
                 result["tijd"] = poging["tijd"]
                 result["baan"] = poging["baan"]
                 result["foutmelding"] = poging.get("foutmelding")
-                logger.info(f"SUCCES{label_str} na {poging_nr} poging(en): "
-                            f"{poging['tijd']} op {poging['baan']}")
+                logger.info("SUCCES%s na %d poging(en): %s op %s",
+                            label_str, poging_nr, poging["tijd"], poging["baan"])
                 if stop_event:
                     stop_event.set()
                 return result
 
             if not poging["retry"]:
                 result["foutmelding"] = poging["foutmelding"]
-                logger.warning(f"Definitief mislukt{label_str} na {poging_nr} pogingen: "
-                               f"{poging['foutmelding']}")
+                logger.warning("Definitief mislukt%s na %d pogingen: %s",
+                               label_str, poging_nr, poging["foutmelding"])
                 return result
 
             # Check of we nog tijd hebben voor een volgende poging
-            if datetime.now(NL_TZ) >= deadline:
+            if time.monotonic() >= deadline_mono:
                 break
 
-            logger.info(f"Nog niet gelukt{label_str} ({poging['foutmelding']}), "
-                        f"volgende poging over {RETRY_INTERVAL_SEC}s...")
-            time.sleep(RETRY_INTERVAL_SEC)
+            interval = min(_retry_interval(poging_nr), deadline_mono - time.monotonic())
+            logger.info("Nog niet gelukt%s (%s), volgende poging over %.1fs...",
+                        label_str, poging["foutmelding"], interval)
+            STOP_SIGNAAL.wait(max(0.0, interval))
 
         # Deadline bereikt
         result["foutmelding"] = (
@@ -419,11 +628,17 @@ def reserveer_met_retry(
         logger.error(f"Onverwachte fout{label_str}: {e}", exc_info=True)
     finally:
         bot.stop()
+        with _retry_loops_lock:
+            _retry_loops_actief -= 1
+        flush_logs()
 
     return result
 
 
-def reserveer_parallel(config: dict, dag_config: dict, dry_run: bool = False, verbose: bool = False) -> dict:
+def reserveer_parallel(
+    config: dict, dag_config: dict, dry_run: bool = False, verbose: bool = False,
+    bot_label: str = "",
+) -> dict:
     """
     Voer een reservering uit met twee parallelle bots, elk gericht op andere banen.
 
@@ -435,20 +650,28 @@ def reserveer_parallel(config: dict, dag_config: dict, dry_run: bool = False, ve
 
     Dit verhoogt de succeskans doordat twee banen tegelijk worden geprobeerd.
     De KNLTB-site blokkeert zelf dubbele boekingen, dus dit is veilig.
+
+    Args:
+        bot_label: Optioneel voorvoegsel voor de bot-labels (bijv. "dinsdag"
+            -> "dinsdag-Bot-A"), nodig als meerdere dagen tegelijk lopen.
     """
     logger = logging.getLogger(__name__)
     dag = dag_config["dag"]
-    baan_voorkeur = config.get("reservering", {}).get("baan_voorkeur", [])
-    n_bots = config.get("reservering", {}).get("parallel_pogingen", 1)
+    reservering_config = config.get("reservering", {})
+    baan_voorkeur = reservering_config.get("baan_voorkeur", [])
+    n_bots = reservering_config.get("parallel_pogingen", 1)
 
     if n_bots <= 1 or len(baan_voorkeur) < 2:
         # Niet genoeg banen om te splitsen, gebruik standaard modus
         logger.info("Parallelle modus niet mogelijk (te weinig banen), gebruik standaard")
-        return reserveer_met_retry(config, dag_config, dry_run=dry_run, verbose=verbose)
+        return reserveer_met_retry(
+            config, dag_config, dry_run=dry_run, verbose=verbose, bot_label=bot_label,
+        )
 
     # Splits baanvoorkeur over de bots
     voorkeur_delen = splits_baan_voorkeur(baan_voorkeur, n_bots)
-    bot_labels = [f"Bot-{chr(65 + i)}" for i in range(n_bots)]  # Bot-A, Bot-B, ...
+    prefix = f"{bot_label}-" if bot_label else ""
+    bot_labels = [f"{prefix}Bot-{chr(65 + i)}" for i in range(n_bots)]  # Bot-A, Bot-B, ...
 
     logger.info("=" * 60)
     logger.info(f"PARALLELLE RESERVERING - {n_bots} bots tegelijk")
@@ -540,15 +763,19 @@ def reserveer_parallel(config: dict, dag_config: dict, dry_run: bool = False, ve
     }
 
 
-def reserveer_voor_dag(config: dict, dag_config: dict, dry_run: bool = False, verbose: bool = False) -> dict:
+def reserveer_voor_dag(
+    config: dict, dag_config: dict, dry_run: bool = False, verbose: bool = False,
+    bot_label: str = "",
+) -> dict:
     """
     Voer een reservering uit voor een specifieke dag (zonder retry, voor lokaal testen).
     """
     logger = logging.getLogger(__name__)
     dag = dag_config["dag"]
     tijden = dag_config.get("tijden", ["19:00"])
-    uren_vooruit = config.get("reservering", {}).get("uren_vooruit", 48)
-    baan_voorkeur = config.get("reservering", {}).get("baan_voorkeur", [])
+    reservering_config = config.get("reservering", {})
+    uren_vooruit = reservering_config.get("uren_vooruit", 48)
+    baan_voorkeur = reservering_config.get("baan_voorkeur", [])
 
     target_date = bereken_target_datum(dag_config, uren_vooruit)
     if target_date is None:
@@ -564,7 +791,7 @@ def reserveer_voor_dag(config: dict, dag_config: dict, dry_run: bool = False, ve
     logger.info(f"=== Reservering voor {dagnaam} {target_date.strftime('%d-%m-%Y')} ===")
     logger.info(f"Voorkeurtijden: {tijden} | Medespelers: {spelers}")
 
-    bot = ApiReserveringBot(config)
+    bot = ApiReserveringBot(config, label=bot_label)
     try:
         bot.start()
         result = bot.reserveer(
@@ -620,7 +847,8 @@ def dump_court_html(config: dict):
     logger = logging.getLogger(__name__)
     logger.info("=== HTML Dump Modus ===")
 
-    dagen_config = config.get("reservering", {}).get("dagen", [])
+    reservering_config = config.get("reservering", {})
+    dagen_config = reservering_config.get("dagen", [])
     if not dagen_config:
         logger.error("Geen dagen geconfigureerd")
         return
@@ -628,7 +856,7 @@ def dump_court_html(config: dict):
     dag_config = dagen_config[0]
     dag = dag_config["dag"]
     tijden = dag_config.get("tijden", ["19:00"])
-    uren_vooruit = config.get("reservering", {}).get("uren_vooruit", 48)
+    uren_vooruit = reservering_config.get("uren_vooruit", 48)
     spelers = get_spelers(config, dag)
 
     from api_bot import ApiReserveringBot
@@ -725,6 +953,8 @@ def main():
         logger.error(f"Fout in config.yaml: {e}")
         sys.exit(1)
 
+    reservering_config = config.get("reservering", {})
+
     # Sync spelers modus
     if args.sync_spelers:
         sync_spelers(config)
@@ -738,7 +968,7 @@ def main():
     # Bepaal welke dag(en) we moeten reserveren
     if args.dag is not None:
         # Specifieke dag opgegeven via command line
-        alle_dagen = config.get("reservering", {}).get("dagen", [])
+        alle_dagen = reservering_config.get("dagen", [])
         te_reserveren = [d for d in alle_dagen if d["dag"] == args.dag]
         if not te_reserveren:
             logger.error(f"Dag {args.dag} ({DAGNAMEN.get(args.dag, '?')}) "
@@ -757,28 +987,44 @@ def main():
     notifier = EmailNotifier(email_config)
 
     # Bepaal of we parallelle modus gebruiken
-    parallel_pogingen = config.get("reservering", {}).get("parallel_pogingen", 1)
+    parallel_pogingen = reservering_config.get("parallel_pogingen", 1)
     if parallel_pogingen > 1:
         logger.info(f"Parallelle modus: {parallel_pogingen} bots tegelijk")
 
-    # Voer reserveringen uit voor alle gevonden dagen
-    resultaten = []
-    for dag_config in te_reserveren:
+    # Voer reserveringen uit voor alle gevonden dagen. Meerdere dagen lopen
+    # tegelijk: anders schuift een latere dag pas aan na de complete retry-loop
+    # van de vorige en mist hij mogelijk zijn eigen venster.
+    meerdere_dagen = len(te_reserveren) > 1
+    labels = [DAGNAMEN.get(d["dag"], str(d["dag"])) for d in te_reserveren]
+    if len(set(labels)) < len(labels):
+        labels = [f"{label}-{i + 1}" for i, label in enumerate(labels)]
+    notifier_lock = threading.Lock()
+
+    # Retry-modi: SIGTERM breekt wachtfases/retry-loop netjes af (vóór het
+    # starten van worker-threads, zodat die het signaalmasker erven)
+    if not args.no_retry:
+        installeer_sigterm_handler()
+
+    def _reserveer_dag(dag_config: dict, label: str) -> dict:
         dagnaam = DAGNAMEN.get(dag_config["dag"], str(dag_config["dag"]))
         logger.info(f"\n--- Reservering voor: {dagnaam} ---")
 
+        # Eigen bot-label per dag = eigen sessiebestand en eigen wizard op de server
+        bot_label = label if meerdere_dagen else ""
         if args.no_retry:
-            result = reserveer_voor_dag(config, dag_config, dry_run=args.dry_run, verbose=args.verbose)
+            result = reserveer_voor_dag(config, dag_config, dry_run=args.dry_run,
+                                        verbose=args.verbose, bot_label=bot_label)
         elif parallel_pogingen > 1:
-            result = reserveer_parallel(config, dag_config, dry_run=args.dry_run, verbose=args.verbose)
+            result = reserveer_parallel(config, dag_config, dry_run=args.dry_run,
+                                        verbose=args.verbose, bot_label=bot_label)
         else:
-            result = reserveer_met_retry(config, dag_config, dry_run=args.dry_run, verbose=args.verbose)
-
-        resultaten.append(result)
+            result = reserveer_met_retry(config, dag_config, dry_run=args.dry_run,
+                                         verbose=args.verbose, bot_label=bot_label)
 
-        # Verstuur notificatie per reservering
+        # Verstuur notificatie per reservering (de SMTP-verbinding is gedeeld)
         if not args.dry_run:
-            notifier.verstuur(result)
+            with notifier_lock:
+                notifier.verstuur(result)
         else:
             logger.info("DRY RUN - Geen e-mail verstuurd")
 
@@ -787,6 +1033,15 @@ def main():
                          f"op baan {result['baan']}")
         else:
             logger.warning(f"MISLUKT: {dagnaam} - {result.get('foutmelding', 'onbekende fout')}")
+        return result
+
+    # Eén SMTP-verbinding voor alle notificaties in deze run
+    with notifier:
+        if meerdere_dagen:
+            with ThreadPoolExecutor(max_workers=len(te_reserveren)) as executor:
+                resultaten = list(executor.map(_reserveer_dag, te_reserveren, labels))
+        else:
+            resultaten = [_reserveer_dag(d, label) for d, label in zip(te_reserveren, labels)]
 
     # Samenvatting
     logger.info("\n" + "=" * 60)
@@ -802,6 +1057,7 @@ def main():
                      f"- {result.get('foutmelding') or 'Gelukt'}")
 
     logger.info("=" * 60)
+    flush_logs()
 
     sys.exit(0 if mislukt == 0 else 1)
 
@@ -12,6 +12,55 @@ from email.mime.text import MIMEText
 
 logger = logging.getLogger(__name__)
 
+# HTML-sjablonen voor de e-mail: eenmalig op moduleniveau, per e-mail alleen
+# nog invullen via str.format_map() i.p.v. de hele pagina als f-string opbouwen.
+_HTML_SUGGESTIE = """
+                <div style="background-color: #fff3cd; border: 1px solid #ffc107; border-radius: 6px; padding: 12px; margin-top: 12px;">
+                    <strong style="color: #856404;">Wat kun je doen?</strong>
+                    <p style="color: #856404; margin: 6px 0 0 0; font-size: 14px;">{suggestie}</p>
+                </div>"""
+
+_HTML_FOUT_SECTIE = """
+                <div style="background-color: #f8d7da; border: 1px solid #f5c6cb; border-radius: 6px; padding: 12px; margin-top: 16px;">
+                    <strong style="color: #721c24;">Reden:</strong>
+                    <p style="color: #721c24; margin: 6px 0 0 0; font-size: 14px;">{foutmelding}</p>
+                </div>
+                {suggestie_html}"""
+
+_HTML_BODY = """
+        <html>
+        <body style="font-family: Arial, sans-serif; max-width: 600px; margin: 0 auto;">
+            <div style="background-color: {status_color}; color: white; padding: 20px; text-align: center; border-radius: 8px 8px 0 0;">
+                <h1 style="margin: 0; font-size: 24px;">{status_icon} Padel Reservering {status_text}</h1>
+            </div>
+            <div style="border: 1px solid #ddd; border-top: none; padding: 20px; border-radius: 0 0 8px 8px;">
+                <table style="width: 100%; border-collapse: collapse;">
+                    <tr>
+                        <td style="padding: 8px; font-weight: bold; color: #555; width: 100px;">Datum</td>
+                        <td style="padding: 8px;">{datum}</td>
+                    </tr>
+                    <tr style="background-color: #f8f9fa;">
+                        <td style="padding: 8px; font-weight: bold; color: #555;">Tijd</td>
+                        <td style="padding: 8px;">{tijd_html}</td>
+                    </tr>
+                    <tr>
+                        <td style="padding: 8px; font-weight: bold; color: #555;">Baan</td>
+                        <td style="padding: 8px;">{baan_html}</td>
+                    </tr>
+                    <tr style="background-color: #f8f9fa;">
+                        <td style="padding: 8px; font-weight: bold; color: #555;">Spelers</td>
+                        <td style="padding: 8px;">{spelers_html}</td>
+                    </tr>
+                </table>
+                {fout_sectie_html}
+            </div>
+            <p style="color: #999; font-size: 12px; text-align: center; margin-top: 16px;">
+                Automatisch verstuurd door Padel Reservering Bot
+            </p>
+        </body>
+        </html>
+        """
+
 
 class EmailNotifier:
     """Verstuurt e-mail notificaties over reserveringsresultaten."""
@@ -33,6 +82,81 @@ class EmailNotifier:
         if not self.wachtwoord:
             self.wachtwoord = os.environ.get("EMAIL_PASSWORD", "")
 
+        # Open SMTP-verbinding; binnen een `with notifier:` blok blijft deze
+        # tussen e-mails open, daarbuiten wordt na elke e-mail afgesloten.
+        self._smtp: smtplib.SMTP | None = None
+        self._hergebruik = False
+
+    def __enter__(self):
+        self._hergebruik = True
+        return self
+
+    def __exit__(self, *exc_info):
+        self._hergebruik = False
+        self._disconnect()
+
+    def _connect(self):
+        """Open een SMTP-verbinding en log in (TLS-handshake + auth)."""
+        if self.use_tls:
+            server = smtplib.SMTP(self.smtp_server, self.smtp_port)
+        else:
+            server = smtplib.SMTP_SSL(self.smtp_server, self.smtp_port)
+        try:
+            if self.use_tls:
+                server.ehlo()
+                server.starttls()
+                server.ehlo()
+            server.login(self.afzender, self.wachtwoord)
+        except Exception:
+            server.close()
+            raise
+        self._smtp = server
+
+    def _disconnect(self):
+        """Sluit de SMTP-verbinding (indien open)."""
+        if self._smtp is None:
+            return
+        try:
+            self._smtp.quit()
+        except (smtplib.SMTPException, OSError):
+            self._smtp.close()
+        self._smtp = None
+
+    def _verbinding_levend(self) -> bool:
+        """Controleer een hergebruikte verbinding met NOOP (na een idle periode vaak al dicht)."""
+        try:
+            return self._smtp.noop()[0] == 250
+        except (smtplib.SMTPException, OSError):
+            return False
+
+    def _send_msg(self, msg: MIMEMultipart):
+        """
+        Verstuur via de open verbinding.
+
+        Een hergebruikte verbinding kan na een lange retry-loop door de server
+        gesloten zijn (vaak met een 421 i.p.v. een nette disconnect). Daarom
+        eerst een NOOP, en bij een fout op een hergebruikte verbinding eenmaal
+        opnieuw verbinden en opnieuw versturen.
+        """
+        hergebruikt = self._smtp is not None
+        if hergebruikt and not self._verbinding_levend():
+            logger.info("SMTP-verbinding niet meer bruikbaar, opnieuw verbinden...")
+            self._disconnect()
+            hergebruikt = False
+        if self._smtp is None:
+            self._connect()
+
+        tekst = msg.as_string()
+        try:
+            self._smtp.sendmail(self.afzender, self.ontvanger, tekst)
+        except (smtplib.SMTPException, OSError) as e:
+            if not (hergebruikt or isinstance(e, smtplib.SMTPServerDisconnected)):
+                raise
+            logger.info(f"SMTP-verbinding verbroken ({e}), opnieuw verbinden...")
+            self._disconnect()
+            self._connect()
+            self._smtp.sendmail(self.afzender, self.ontvanger, tekst)
+
     def verstuur(self, result: dict) -> bool:
         """
         Verstuur een e-mail notificatie met het reserveringsresultaat.
@@ -68,18 +192,9 @@ class EmailNotifier:
             msg.attach(MIMEText(body_html, "html", "utf-8"))
 
             logger.info(f"E-mail versturen naar {self.ontvanger}...")
-
-            if self.use_tls:
-                with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                    server.ehlo()
-                    server.starttls()
-                    server.ehlo()
-                    server.login(self.afzender, self.wachtwoord)
-                    server.sendmail(self.afzender, self.ontvanger, msg.as_string())
-            else:
-                with smtplib.SMTP_SSL(self.smtp_server, self.smtp_port) as server:
-                    server.login(self.afzender, self.wachtwoord)
-                    server.sendmail(self.afzender, self.ontvanger, msg.as_string())
+            self._send_msg(msg)
+            if not self._hergebruik:
+                self._disconnect()
 
             logger.info("E-mail succesvol verstuurd!")
             return True
@@ -89,9 +204,11 @@ class EmailNotifier:
                 "E-mail authenticatie mislukt. Controleer je e-mail wachtwoord. "
                 "Voor Gmail: gebruik een App Password (https://myaccount.google.com/apppasswords)"
             )
+            self._disconnect()
             return False
         except Exception as e:
             logger.error(f"Fout bij versturen e-mail: {e}")
+            self._disconnect()
             return False
 
     def _maak_onderwerp(self, result: dict) -> str:
@@ -195,66 +312,25 @@ class EmailNotifier:
     def _maak_body_html(self, result: dict) -> str:
         """Maak de HTML body van de e-mail."""
         success = result.get("success", False)
-        status_color = "#28a745" if success else "#dc3545"
-        status_text = "GERESERVEERD" if success else "MISLUKT"
-        status_icon = "&#9989;" if success else "&#10060;"
-
         spelers = result.get("spelers", [])
-        spelers_html = ", ".join(spelers) if spelers else "<em>geen</em>"
-
-        tijd_html = result.get('tijd') or '<em>niet gereserveerd</em>'
-        baan_html = result.get('baan') or '<em>niet gereserveerd</em>'
 
         # Foutmelding sectie (alleen bij falen)
         fout_sectie_html = ""
         if result.get("foutmelding") and not success:
             foutmelding = result['foutmelding']
             suggestie = self._maak_suggestie(foutmelding)
-            suggestie_html = ""
-            if suggestie:
-                suggestie_html = f"""
-                <div style="background-color: #fff3cd; border: 1px solid #ffc107; border-radius: 6px; padding: 12px; margin-top: 12px;">
-                    <strong style="color: #856404;">Wat kun je doen?</strong>
-                    <p style="color: #856404; margin: 6px 0 0 0; font-size: 14px;">{suggestie}</p>
-                </div>"""
-
-            fout_sectie_html = f"""
-                <div style="background-color: #f8d7da; border: 1px solid #f5c6cb; border-radius: 6px; padding: 12px; margin-top: 16px;">
-                    <strong style="color: #721c24;">Reden:</strong>
-                    <p style="color: #721c24; margin: 6px 0 0 0; font-size: 14px;">{foutmelding}</p>
-                </div>
-                {suggestie_html}"""
-
-        return f"""
-        <html>
-        <body style="font-family: Arial, sans-serif; max-width: 600px; margin: 0 auto;">
-            <div style="background-color: {status_color}; color: white; padding: 20px; text-align: center; border-radius: 8px 8px 0 0;">
-                <h1 style="margin: 0; font-size: 24px;">{status_icon} Padel Reservering {status_text}</h1>
-            </div>
-            <div style="border: 1px solid #ddd; border-top: none; padding: 20px; border-radius: 0 0 8px 8px;">
-                <table style="width: 100%; border-collapse: collapse;">
-                    <tr>
-                        <td style="padding: 8px; font-weight: bold; color: #555; width: 100px;">Datum</td>
-                        <td style="padding: 8px;">{result.get('datum', 'onbekend')}</td>
-                    </tr>
-                    <tr style="background-color: #f8f9fa;">
-                        <td style="padding: 8px; font-weight: bold; color: #555;">Tijd</td>
-                        <td style="padding: 8px;">{tijd_html}</td>
-                    </tr>
-                    <tr>
-                        <td style="padding: 8px; font-weight: bold; color: #555;">Baan</td>
-                        <td style="padding: 8px;">{baan_html}</td>
-                    </tr>
-                    <tr style="background-color: #f8f9fa;">
-                        <td style="padding: 8px; font-weight: bold; color: #555;">Spelers</td>
-                        <td style="padding: 8px;">{spelers_html}</td>
-                    </tr>
-                </table>
-                {fout_sectie_html}
-            </div>
-            <p style="color: #999; font-size: 12px; text-align: center; margin-top: 16px;">
-                Automatisch verstuurd door Padel Reservering Bot
-            </p>
-        </body>
-        </html>
-        """
+            fout_sectie_html = _HTML_FOUT_SECTIE.format_map({
+                "foutmelding": foutmelding,
+                "suggestie_html": _HTML_SUGGESTIE.format_map({"suggestie": suggestie}) if suggestie else "",
+            })
+
+        return _HTML_BODY.format_map({
+            "status_color": "#28a745" if success else "#dc3545",
+            "status_text": "GERESERVEERD" if success else "MISLUKT",
+            "status_icon": "&#9989;" if success else "&#10060;",
+            "datum": result.get('datum', 'onbekend'),
+            "tijd_html": result.get('tijd') or '<em>niet gereserveerd</em>',
+            "baan_html": result.get('baan') or '<em>niet gereserveerd</em>',
+            "spelers_html": ", ".join(spelers) if spelers else "<em>geen</em>",
+            "fout_sectie_html": fout_sectie_html,
+        })